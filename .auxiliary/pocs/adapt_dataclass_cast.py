@@ -12,15 +12,54 @@ Status: Passes Pyright strict checking (0 errors)
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from typing import Any, TypedDict, cast
+from functools import lru_cache
+from typing import Any, Callable, TypedDict, cast
 import sys
 sys.path.insert(0, '/home/me/src/python-absence/sources')
 
-from absence import absent, is_absent, Absential
+from absence import absent, Absential
 
 
 # ===== The core helper function (truly Pyright-clean) =====
 
+@lru_cache(maxsize=128, typed=True)
+def _compile_extractor(
+    cls: type,
+    skip_value: object,
+) -> Callable[[Any], dict[str, Any]]:
+    """Generate and cache a straight-line extractor for a dataclass type.
+
+    The generated function reads each field by plain attribute access and
+    compares it against the skip value, which is bound into its globals.
+    Extractors live in a bounded LRU cache keyed on the type and the skip
+    value, so a fresh skip value per call recompiles each time but cannot
+    grow memory without limit. Skip values must be hashable and are
+    matched by equality; sentinels such as None or object() instances
+    compare by identity, which is what the extractor tests.
+    """
+    if getattr(cls, '__dataclass_fields__', None) is None:
+        msg = f"{cls} is not a dataclass"
+        raise TypeError(msg)
+    names = tuple(field.name for field in fields(cls))
+    lines = ['def extract(obj):']
+    if not names:
+        lines.append('    return {}')
+    for index, name in enumerate(names):
+        lines.append(f'    value = obj.{name}')
+        if index:
+            lines.append(
+                f'    if value is not _SKIP: result[{name!r}] = value')
+        else:  # First declared field builds the dict as a literal.
+            lines.append(
+                f'    result = {{}} if value is _SKIP else {{{name!r}: value}}')
+    if names:
+        lines.append('    return result')
+    namespace: dict[str, Any] = {'_SKIP': skip_value}
+    code = compile('\n'.join(lines), f'<adapt:{cls.__qualname__}>', 'exec')
+    exec(code, namespace)  # noqa: S102
+    return namespace['extract']
+
+
 def adapt_dataclass(
     obj: object,
     *,
@@ -33,7 +72,9 @@ def adapt_dataclass(
 
     Args:
         obj: Dataclass instance to adapt
-        skip_value: Value to skip when extracting fields (default: None)
+        skip_value: Value to skip when extracting fields (default: None).
+            Should be a long-lived, hashable sentinel; extractors are
+            cached per skip value in a bounded cache.
 
     Returns:
         Dictionary mapping field names to values (excluding skip_value fields)
@@ -55,17 +96,7 @@ def adapt_dataclass(
         >>> result = adapt_dataclass(cmd)
         >>> kwargs = cast(UpdateKwargs, result)  # Cast at call site
     """
-    if not hasattr(obj, '__dataclass_fields__'):
-        msg = f"{obj} is not a dataclass instance"
-        raise TypeError(msg)
-
-    result: dict[str, Any] = {}
-    for field in fields(obj):  # type: ignore[arg-type]
-        value = getattr(obj, field.name)
-        if value is not skip_value:
-            result[field.name] = value
-
-    return result
+    return _compile_extractor(type(obj), skip_value)(obj)
 
 
 # ===== Example usage =====
@@ -76,14 +107,11 @@ def update_user(
     age: Absential[int | None] = absent,
 ) -> dict[str, Any]:
     """Update user with partial data."""
-    result: dict[str, Any] = {}
-    if not is_absent(name):
-        result['name'] = name
-    if not is_absent(email):
-        result['email'] = email
-    if not is_absent(age):
-        result['age'] = age
-    return result
+    return {
+        key: value
+        for key, value in (('name', name), ('email', email), ('age', age))
+        if value is not absent
+    }
 
 
 class UpdateUserKwargs(TypedDict, total=False):
@@ -150,18 +178,17 @@ def update_profile(
     verified: Absential[bool] = absent,
 ) -> dict[str, Any]:
     """Update user profile."""
-    result: dict[str, Any] = {}
-    if not is_absent(username):
-        result['username'] = username
-    if not is_absent(email):
-        result['email'] = email
-    if not is_absent(age):
-        result['age'] = age
-    if not is_absent(bio):
-        result['bio'] = bio
-    if not is_absent(verified):
-        result['verified'] = verified
-    return result
+    return {
+        key: value
+        for key, value in (
+            ('username', username),
+            ('email', email),
+            ('age', age),
+            ('bio', bio),
+            ('verified', verified),
+        )
+        if value is not absent
+    }
 
 
 class UpdateProfileKwargs(TypedDict, total=False):
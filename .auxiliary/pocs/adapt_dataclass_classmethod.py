@@ -12,34 +12,89 @@ Status: Passes Pyright strict checking (0 errors)
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from typing import Any, TypedDict
+from functools import lru_cache
+from typing import Any, Callable, TypedDict, TypeVar
 
 # Self is in typing_extensions for Python < 3.11
 from typing_extensions import Self
 import sys
 sys.path.insert(0, '/home/me/src/python-absence/sources')
 
-from absence import absent, is_absent, Absential
+from absence import absent, Absential
+
+D = TypeVar('D')
+K = TypeVar('K')
 
 
 # ===== Core helper function (for comparison) =====
 
+@lru_cache(maxsize=128, typed=True)
+def _compile_extractor(
+    cls: type,
+    skip_value: object,
+) -> Callable[[Any], dict[str, Any]]:
+    """Generate and cache a straight-line extractor for a dataclass type.
+
+    The generated function reads each field by plain attribute access and
+    compares it against the skip value, which is bound into its globals.
+    Extractors live in a bounded LRU cache keyed on the type and the skip
+    value, so a fresh skip value per call recompiles each time but cannot
+    grow memory without limit. Skip values must be hashable and are
+    matched by equality; sentinels such as None or object() instances
+    compare by identity, which is what the extractor tests.
+    """
+    if getattr(cls, '__dataclass_fields__', None) is None:
+        msg = f"{cls} is not a dataclass"
+        raise TypeError(msg)
+    names = tuple(field.name for field in fields(cls))
+    lines = ['def extract(obj):']
+    if not names:
+        lines.append('    return {}')
+    for index, name in enumerate(names):
+        lines.append(f'    value = obj.{name}')
+        if index:
+            lines.append(
+                f'    if value is not _SKIP: result[{name!r}] = value')
+        else:  # First declared field builds the dict as a literal.
+            lines.append(
+                f'    result = {{}} if value is _SKIP else {{{name!r}: value}}')
+    if names:
+        lines.append('    return result')
+    namespace: dict[str, Any] = {'_SKIP': skip_value}
+    code = compile('\n'.join(lines), f'<adapt:{cls.__qualname__}>', 'exec')
+    exec(code, namespace)  # noqa: S102
+    return namespace['extract']
+
+
 def adapt_dataclass(
     obj: object,
     *,
     skip_value: object = None,
 ) -> dict[str, Any]:
-    """Extract non-sentinel fields from dataclass."""
-    if not hasattr(obj, '__dataclass_fields__'):
-        msg = f"{obj} is not a dataclass instance"
-        raise TypeError(msg)
+    """Extract non-sentinel fields from dataclass.
+
+    The skip value should be a long-lived, hashable sentinel; extractors
+    are cached per skip value in a bounded cache.
+    """
+    return _compile_extractor(type(obj), skip_value)(obj)
 
-    result: dict[str, Any] = {}
-    for field in fields(obj):  # type: ignore[arg-type]
-        value = getattr(obj, field.name)
-        if value is not skip_value:
-            result[field.name] = value
-    return result
+
+def typed_adapter(
+    cls: type[D],
+    kwargs_type: type[K],
+    *,
+    skip_value: object = None,
+) -> Callable[[D], K]:
+    """Generate an adapter from a dataclass to a TypedDict.
+
+    Compiles the extractor for the dataclass up front, so calls go
+    straight to the generated function with no classmethod frame and no
+    cache lookup. The TypedDict is only used for the return type. The
+    extractor does not check the type of its argument at runtime; the
+    signature restricts it to instances of the dataclass it was generated
+    for, so type checkers catch other arguments.
+    """
+    return _compile_extractor(cls, skip_value)  # type: ignore[return-value]
 
 
 # ===== Approach 1: Classmethod directly on TypedDict =====
@@ -72,12 +127,11 @@ def update_user(
     email: Absential[str | None] = absent,
 ) -> dict[str, Any]:
     """Update user."""
-    result: dict[str, Any] = {}
-    if not is_absent(name):
-        result['name'] = name
-    if not is_absent(email):
-        result['email'] = email
-    return result
+    return {
+        key: value
+        for key, value in (('name', name), ('email', email))
+        if value is not absent
+    }
 
 
 def test_direct_classmethod() -> None:
@@ -97,6 +151,28 @@ def test_direct_classmethod() -> None:
     print()
 
 
+# ===== Approach 1b: Generated adapter for TypedDict =====
+
+# TypedDict bodies may only hold annotations, so the generated adapter
+# lives at module level rather than on the TypedDict.
+update_user_kwargs_from_command = typed_adapter(
+    UpdateUserCommand, UpdateUserKwargs)
+
+
+def test_generated_adapter() -> None:
+    print("=== Generated adapter for TypedDict ===\n")
+
+    cmd = UpdateUserCommand(email="alice@example.com")
+    kwargs = update_user_kwargs_from_command(cmd)
+
+    print(f"Command: {cmd}")
+    print(f"Kwargs: {kwargs}")
+
+    result = update_user(**kwargs)
+    print(f"Result: {result}")
+    print()
+
+
 # ===== Approach 2: Comparison with cast() approach =====
 
 class UpdateProfileKwargs(TypedDict, total=False):
@@ -117,12 +193,11 @@ def update_profile(
     bio: Absential[str | None] = absent,
 ) -> dict[str, Any]:
     """Update profile."""
-    result: dict[str, Any] = {}
-    if not is_absent(username):
-        result['username'] = username
-    if not is_absent(bio):
-        result['bio'] = bio
-    return result
+    return {
+        key: value
+        for key, value in (('username', username), ('bio', bio))
+        if value is not absent
+    }
 
 
 def test_cast_approach() -> None:
@@ -194,5 +269,6 @@ Which is better? Depends on preference:
 
 if __name__ == '__main__':
     test_direct_classmethod()
+    test_generated_adapter()
     test_cast_approach()
     comparison()
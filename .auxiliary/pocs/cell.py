@@ -1,46 +1,80 @@
 #!/usr/bin/env python3
-"""AbsenceCell implementation using is_present() for type narrowing.
+"""AbsenceCell implementation with inlined absence checks.
 
-This version eliminates type: ignore comments by using a TypeIs predicate.
+Methods compare against the module-level sentinel directly, rather than
+calling the is_present() predicate. This trades TypeIs narrowing
+for one identity check per call; narrowing is restored with rule-specific
+pyright: ignore comments (reportReturnType, reportArgumentType) where the
+contained value is returned or passed on, so other errors on those lines
+still surface. Those are used rather than cast() or assert, which would
+cost a call or a check at runtime on every dispatch.
 
-Status: Passes Pyright strict checking (0 errors, 1 type: ignore for edge case)
+Status: Passes Pyright strict checking (0 errors, Pyright 1.1.414), with
+targeted pyright: ignore comments in place of narrowing.
+
+The module also compiles unchanged with Cython (pure Python mode):
+
+    cythonize -i -3 cell.py
+
+AbsenceCell is left as a regular Python class rather than a cclass because
+extension types cannot derive from Generic[T].
 """
 
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Callable, overload
+from typing import (
+    Any, Callable, ClassVar, Final, Generic, NoReturn, TypeVar, final,
+    overload,
+)
 from typing_extensions import TypeIs
 
+# Lowercase, as a flag assigned in two branches is not a constant to Pyright.
+try:
+    import cython  # pyright: ignore[reportMissingTypeStubs]
+except ImportError:
+    compiled = False
+else:
+    compiled = bool(cython.compiled)
+
 # ============================================================================
 # Absence types
 # ============================================================================
 
-class AbsentSingleton:
-    _instance: AbsentSingleton | None = None
+class _AbsentSingleton:
+    """Type of the absent sentinel. Only instance is `absent`."""
     
-    def __new__(cls) -> AbsentSingleton:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = ()
+    
+    def __new__(cls) -> NoReturn:
+        raise TypeError("Cannot instantiate; use the 'absent' sentinel.")
     
     def __bool__(self) -> bool:
         return False
     
+    def __reduce__(self) -> str:
+        # Copies and unpickles resolve to the module-level sentinel.
+        return 'absent'
+    
     def __repr__(self) -> str:
         return 'absent'
 
-absent = AbsentSingleton()
+# Constructed once at import; bypasses the raising __new__.
+absent: Final[_AbsentSingleton] = object.__new__(_AbsentSingleton)
+_ABSENT_HASH = hash(absent)
 
 T = TypeVar('T')
 U = TypeVar('U')
-Absential = T | AbsentSingleton
+# Note: Subscriptions such as Absential[int] are memoized by typing itself,
+#       and annotations in this module are never evaluated at runtime
+#       (postponed evaluation), so no extra caching is layered on here.
+Absential = T | _AbsentSingleton
 
 
 # ============================================================================
 # Type guard predicates
 # ============================================================================
 
-def is_absent(value: Absential[T]) -> TypeIs[AbsentSingleton]:
+def is_absent(value: Absential[T]) -> TypeIs[_AbsentSingleton]:
     """Check if value is absent. Narrows type in both branches."""
     return value is absent
 
@@ -50,15 +84,11 @@ def is_present(value: Absential[T]) -> TypeIs[T]:
     return value is not absent
 
 
-def _is_not_none(value: T | None) -> TypeIs[T]:
-    """Check if value is not None. Used for from_optional narrowing."""
-    return value is not None
-
-
 # ============================================================================
 # AbsenceCell
 # ============================================================================
 
+@final
 class AbsenceCell(Generic[T]):
     """Container for potentially absent values.
     
@@ -68,8 +98,15 @@ class AbsenceCell(Generic[T]):
     Similar in spirit to Option/Maybe monads, but integrated with the
     absence package's paradigm where `absent` is distinct from `None`.
     
-    Uses is_present() TypeIs predicate for type narrowing, eliminating
-    the need for type: ignore comments in most methods.
+    Hot methods check `self._value is not absent` inline, so no predicate
+    call is made per dispatch. The module-level is_present() and
+    is_absent() predicates remain available for callers that want TypeIs
+    narrowing.
+    
+    The raw contained value (which may be absent) is exposed through the
+    read-only `value` property; methods read the underlying slot directly.
+    Use it when you need to pass the value to functions expecting
+    Absential[T].
     
     Examples:
         # Create cells
@@ -92,13 +129,27 @@ class AbsenceCell(Generic[T]):
         # Evaluate with default
         result = cell.evaluate_or(lambda x: x > 0, default=True)
         fits = columns_max.evaluate_or_true(lambda n: size <= n)
+        
+        # Fused chains (preferred; no intermediate cells)
+        width = cell.map_or(len, 0)        # cell.map(len).extract_or(0)
+        sizes = cell.filter_map(bool, len) # cell.filter(bool).map(len)
     """
     
     __slots__ = ('_value',)
     
+    _EMPTY: ClassVar[AbsenceCell[Any] | None] = None
+    
     def __init__(self, value: Absential[T] = absent) -> None:
         self._value: Absential[T] = value
     
+    def __class_getitem__(cls, item: object) -> type[AbsenceCell[Any]]:
+        """Return the class itself; subscripts only matter to type checkers.
+        
+        Avoids building a typing generic alias, and proxying through it,
+        for runtime expressions such as `AbsenceCell[int](42)`.
+        """
+        return cls
+    
     # -------------------------------------------------------------------------
     # Factory Methods
     # -------------------------------------------------------------------------
@@ -110,8 +161,17 @@ class AbsenceCell(Generic[T]):
     
     @classmethod
     def empty(cls) -> AbsenceCell[T]:
-        """Create an empty (absent) cell."""
-        return cls(absent)
+        """Return the shared empty (absent) cell for this class.
+        
+        All empty cells are observationally equivalent, so one instance is
+        interned rather than allocating on every call. This is safe since
+        the contained value is only exposed through a read-only property.
+        """
+        empty = cls._EMPTY
+        if empty is None:
+            # Lazily filled once; not a redefinition in practice.
+            empty = cls._EMPTY = cls(absent)  # pyright: ignore[reportConstantRedefinition]
+        return empty  # type: ignore[return-value]
     
     @overload
     @classmethod
@@ -134,10 +194,29 @@ class AbsenceCell(Generic[T]):
                            If False, None is stored as a value.
         """
         if none_is_absent:
-            if _is_not_none(value):
-                return cls(value)  # Narrowed to T by TypeIs
-            return cls(absent)
-        # When none_is_absent=False, None is a valid value to store
+            return cls.from_optional_skipping_none(value)
+        return cls.from_optional_keeping_none(value)
+    
+    @classmethod
+    def from_optional_skipping_none(cls, value: T | None) -> AbsenceCell[T]:
+        """Create a cell from an Optional[T] value, with None as absent.
+        
+        Specialization of from_optional for call sites which always treat
+        None as absent; avoids the keyword argument and its branch.
+        """
+        if value is None:
+            return cls.empty()
+        return cls(value)
+    
+    @classmethod
+    def from_optional_keeping_none(
+        cls, value: T | None
+    ) -> AbsenceCell[T | None]:
+        """Create a cell from an Optional[T] value, storing None as a value.
+        
+        Specialization of from_optional for call sites where None is a
+        valid value.
+        """
         # We need ignore here because T|None can't narrow to exclude None
         return cls(value)  # type: ignore[arg-type]
     
@@ -165,8 +244,7 @@ class AbsenceCell(Generic[T]):
     def value(self) -> Absential[T]:
         """Access the raw contained value (which may be absent).
         
-        Use this when you need to pass the value to functions expecting
-        Absential[T].
+        Read-only, so that the interned empty cell cannot be altered.
         """
         return self._value
     
@@ -176,20 +254,21 @@ class AbsenceCell(Generic[T]):
         Raises:
             ValueError: If the cell is absent.
         """
-        if is_present(self._value):
-            return self._value  # Narrowed to T by TypeIs
+        value = self._value
+        if value is not absent:
+            return value  # pyright: ignore[reportReturnType]
         raise ValueError("Cannot extract from absent cell")
     
     def extract_or(self, default: T) -> T:
         """Extract the value if occupied, otherwise return the default."""
-        if is_present(self._value):
-            return self._value  # Narrowed to T by TypeIs
-        return default
+        value = self._value
+        return value if value is not absent else default  # pyright: ignore[reportReturnType]
     
     def extract_or_compute(self, factory: Callable[[], T]) -> T:
         """Extract the value if occupied, otherwise compute a default."""
-        if is_present(self._value):
-            return self._value  # Narrowed to T by TypeIs
+        value = self._value
+        if value is not absent:
+            return value  # pyright: ignore[reportReturnType]
         return factory()
     
     # -------------------------------------------------------------------------
@@ -198,10 +277,14 @@ class AbsenceCell(Generic[T]):
     
     def evaluate_or(self, func: Callable[[T], U], default: U) -> U:
         """Apply func to the value if occupied, else return default."""
-        if is_present(self._value):
-            return func(self._value)  # Narrowed to T by TypeIs
+        value = self._value
+        if value is not absent:
+            return func(value)  # pyright: ignore[reportArgumentType]
         return default
     
+    # Fused `cell.map(func).extract_or(default)`; no intermediate cell
+    map_or = evaluate_or
+    
     def evaluate_or_true(self, predicate: Callable[[T], bool]) -> bool:
         """Apply predicate if occupied, else return True.
         
@@ -211,11 +294,13 @@ class AbsenceCell(Generic[T]):
             if columns_max.evaluate_or_true(lambda n: address_size <= n):
                 lines.append(address)
         """
-        return self.evaluate_or(predicate, True)
+        value = self._value
+        return True if value is absent else predicate(value)  # pyright: ignore[reportArgumentType]
     
     def evaluate_or_false(self, predicate: Callable[[T], bool]) -> bool:
         """Apply predicate if occupied, else return False."""
-        return self.evaluate_or(predicate, False)
+        value = self._value
+        return False if value is absent else predicate(value)  # pyright: ignore[reportArgumentType]
     
     # -------------------------------------------------------------------------
     # Transformation Methods
@@ -229,9 +314,10 @@ class AbsenceCell(Generic[T]):
         Example:
             adjusted = columns_max.map(lambda n: n - 4)
         """
-        if is_present(self._value):
-            return AbsenceCell[U](func(self._value))  # Narrowed to T by TypeIs
-        return AbsenceCell[U](absent)
+        value = self._value
+        if value is not absent:
+            return AbsenceCell(func(value))  # pyright: ignore[reportArgumentType]
+        return AbsenceCell.empty()  # pyright: ignore[reportUnknownVariableType]
     
     # Alias for those who prefer the more explicit name
     evaluate_or_absent = map
@@ -241,16 +327,31 @@ class AbsenceCell(Generic[T]):
         
         Like map, but func returns an AbsenceCell. Avoids nested cells.
         """
-        if is_present(self._value):
-            return func(self._value)  # Narrowed to T by TypeIs
-        return AbsenceCell[U](absent)
+        value = self._value
+        if value is not absent:
+            return func(value)  # pyright: ignore[reportArgumentType]
+        return AbsenceCell.empty()  # pyright: ignore[reportUnknownVariableType]
     
     def filter(self, predicate: Callable[[T], bool]) -> AbsenceCell[T]:
         """Keep the value only if predicate returns True."""
-        if is_present(self._value):
-            if predicate(self._value):  # Narrowed to T by TypeIs
-                return self
-        return AbsenceCell[T](absent)
+        value = self._value
+        if value is not absent and predicate(value):  # pyright: ignore[reportArgumentType]
+            return self
+        return AbsenceCell.empty()  # pyright: ignore[reportUnknownVariableType]
+    
+    def filter_map(
+        self,
+        predicate: Callable[[T], bool],
+        func: Callable[[T], U],
+    ) -> AbsenceCell[U]:
+        """Filter then map in one step, without an intermediate cell.
+        
+        Equivalent to `cell.filter(predicate).map(func)`.
+        """
+        value = self._value
+        if value is absent or not predicate(value):  # pyright: ignore[reportArgumentType]
+            return AbsenceCell.empty()  # pyright: ignore[reportUnknownVariableType]
+        return AbsenceCell(func(value))  # pyright: ignore[reportArgumentType]
     
     # -------------------------------------------------------------------------
     # Fallback Methods
@@ -262,13 +363,11 @@ class AbsenceCell(Generic[T]):
         Useful for fallback chains:
             effective = user_pref.or_else(system_default).or_else(hardcoded)
         """
-        if is_present(self._value):
-            return self
-        return alternative
+        return self if self._value is not absent else alternative
     
     def or_compute(self, factory: Callable[[], AbsenceCell[T]]) -> AbsenceCell[T]:
         """Return self if occupied, else compute alternative lazily."""
-        if is_present(self._value):
+        if self._value is not absent:
             return self
         return factory()
     
@@ -278,32 +377,35 @@ class AbsenceCell(Generic[T]):
     
     def to_optional(self) -> T | None:
         """Convert to Optional[T], where absent becomes None."""
-        if is_present(self._value):
-            return self._value  # Narrowed to T by TypeIs
-        return None
+        value = self._value
+        return value if value is not absent else None  # pyright: ignore[reportReturnType]
     
     # -------------------------------------------------------------------------
     # Dunder Methods
     # -------------------------------------------------------------------------
     
     def __repr__(self) -> str:
-        if is_present(self._value):
-            return f'AbsenceCell({self._value!r})'
+        value = self._value
+        if value is not absent:
+            return f'AbsenceCell({value!r})'
         return 'AbsenceCell()'
     
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, AbsenceCell):
-            if is_absent(self._value) and is_absent(other._value):
-                return True
-            if is_present(self._value) and is_present(other._value):
-                return self._value == other._value
-            return False
+        if self is other:
+            return True
+        if type(other) is AbsenceCell:  # Final class; no MRO walk needed.
+            value = self._value
+            other_value = other._value  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            if value is absent:
+                return other_value is absent
+            if other_value is absent:
+                return False
+            return value == other_value  # pyright: ignore[reportUnknownVariableType]
         return NotImplemented
     
     def __hash__(self) -> int:
-        if is_present(self._value):
-            return hash(self._value)
-        return hash(absent)
+        value = self._value
+        return hash(value) if value is not absent else _ABSENT_HASH
 
 
 # ============================================================================
@@ -328,6 +430,10 @@ def test_all_methods() -> None:
     assert full.extract() == 42
     assert full.extract_or(0) == 42
     assert full.evaluate_or(lambda x: x + 1, -1) == 43
+    assert full.evaluate_or_true(lambda x: x < 0) is False
+    assert empty.evaluate_or_true(lambda x: x < 0) is True
+    assert full.evaluate_or_false(lambda x: x > 0) is True
+    assert empty.evaluate_or_false(lambda x: x > 0) is False
     assert full.map(lambda x: x * 2).extract() == 84
     
     # Chaining
@@ -338,17 +444,25 @@ def test_all_methods() -> None:
         .extract_or(0)
     )
     assert result == 96
+    assert AbsenceCell(100).map_or(lambda x: x - 4, 0) == 96
+    assert empty.map_or(lambda x: x - 4, 0) == 0
+    assert AbsenceCell(100).filter_map(lambda x: x > 0, str).extract() == '100'
+    assert AbsenceCell(-1).filter_map(lambda x: x > 0, str).is_absent()
+    assert empty.filter_map(lambda x: x > 0, str).is_absent()
     
     # from_optional
-    assert AbsenceCell.from_optional(None).is_absent()
-    assert AbsenceCell.from_optional("hello").extract() == "hello"
+    assert AbsenceCell[str].from_optional(None).is_absent()
+    assert AbsenceCell[str].from_optional("hello").extract() == "hello"
+    assert AbsenceCell[str].from_optional(None, none_is_absent=False).is_occupied()
+    assert AbsenceCell[str].from_optional_skipping_none(None).is_absent()
+    assert AbsenceCell[str].from_optional_keeping_none(None).extract() is None
     
     # Fallbacks
     empty_cell: AbsenceCell[int] = AbsenceCell()
     default_cell: AbsenceCell[int] = AbsenceCell(10)
     assert empty_cell.or_else(default_cell).extract() == 10
     
-    print("All tests passed!")
+    print(f"All tests passed! (compiled: {compiled})")
 
 
 if __name__ == '__main__':
@@ -12,22 +12,37 @@
 
 
 def _calculate_copyright_notice( ):
-    from datetime import datetime as DateTime, timezone as TimeZone
+    from os import environ
     first_year = 2024
-    now_year = DateTime.now( TimeZone.utc ).year
+    # Note: Reproducible builds pin time; no need for 'datetime' then.
+    epoch = environ.get( 'SOURCE_DATE_EPOCH' )
+    if epoch:
+        from time import gmtime
+        now_year = gmtime( int( epoch ) ).tm_year
+    else:
+        from datetime import datetime as DateTime, timezone as TimeZone
+        now_year = DateTime.now( TimeZone.utc ).year
     if first_year < now_year: year_range = f"{first_year}-{now_year}"
     else: year_range = str( first_year )
     return f"{year_range}, Eric McDonald"
 
 
 def _import_version( ):
-    from importlib import import_module
+    from ast import literal_eval
     from pathlib import Path
     from sys import path
     project_location = Path( __file__ ).parent.parent
-    path.insert( 0, str( project_location / 'sources' ) )
-    module = import_module( 'absence' )
-    return module.__version__
+    sources_location = project_location / 'sources'
+    # Note: Autodoc still imports the package from sources.
+    path.insert( 0, str( sources_location ) )
+    # Note: Version read from same file as Hatch uses, without executing
+    #       package initialization and its dependency imports.
+    module_location = sources_location / 'absence' / '__init__.py'
+    for line in module_location.read_text( encoding = 'utf-8' ).splitlines( ):
+        if not line.startswith( '__version__' ): continue
+        return literal_eval( line.split( '=', maxsplit = 1 )[ 1 ].strip( ) )
+    msg = f"No '__version__' in {module_location}."
+    raise RuntimeError( msg )
 
 
 # -- Project information -----------------------------------------------------
@@ -73,7 +88,9 @@ source_suffix = {
 }
 
 nitpicky = True
-nitpick_ignore = [
+# Note: Set for hashed membership tests against each unresolved reference.
+#       Sphinx accepts set, list, or tuple; frozenset triggers a type warning.
+nitpick_ignore = {
     # Workaround for https://bugs.python.org/issue11975
     # Found on Stack Overflow (credit to Astropy project):
     #   https://stackoverflow.com/a/30624034
@@ -97,7 +114,7 @@ nitpick_ignore = [
     ( 'py:class', "typing_extensions.Any" ),
     ( 'py:class', "typing_extensions.Self" ),
     ( 'py:class', "typing_extensions.TypeIs" ),
-]
+}
 
 # -- Options for linkcheck builder -------------------------------------------
 
@@ -108,7 +125,6 @@ linkcheck_ignore = [
     r'https://stackoverflow\.com/help/.*',
     # Repository does not exist during initial development.
     r'https://github\.com/emcd/python-absence',
-    r'https://github\.com/emcd/python-absence/.*',
     # Package does not exist during initial development.
     r'https://pypi.org/project/absence/',
     # Github aggressively rate-limits access to certain blobs.
@@ -162,6 +178,10 @@ intersphinx_mapping = {
   # --- END: Injected by Copier ---
 }
 
+# Note: Inventories are cached with the build environment and never expire.
+#       Fresh environments ('sphinx-build -E') fetch them again.
+intersphinx_cache_limit = -1
+
 # -- Options for Myst extension ----------------------------------------------
 
 # https://myst-parser.readthedocs.io/en/latest/syntax/optional.html
@@ -24,6 +24,7 @@
 
 
 import collections.abc as   cabc
+import functools as         funct
 import                      types
 
 import classcore.standard as    ccstd
@@ -39,4 +39,10 @@ class OperationValidityError( Omnierror, RuntimeError, TypeError ):
     ''' Attempt to perform invalid operation. '''
 
     def __init__( self, name: str ) -> None:
-        super( ).__init__( f"Operation {name!r} is not valid on this object." )
+        super( ).__init__( _produce_operation_validity_message( name ) )
+
+
+@__.funct.lru_cache( maxsize = 64 )
+def _produce_operation_validity_message( name: str ) -> str:
+    # Note: Operation names are few and fixed, such as 'pickle'.
+    return f"Operation {name!r} is not valid on this object."
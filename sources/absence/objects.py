@@ -23,14 +23,24 @@
 
 from __future__ import annotations
 
+# Note: Imported eagerly. The global sentinel is an instance of a Falsifier
+#       subclass, so any use of 'absent' needs this module anyway, and the
+#       bulk of package import cost is in 'classcore' and 'dynadoc', which
+#       the package hub and module finalization already require.
 import falsifier as _falsifier
 
 from . import __
+from . import exceptions as _exceptions
 
 
 class AbsenceFactory( _falsifier.Falsifier ):
     ''' Produces arbitrary absence sentinels. '''
 
+    # Note: Falsifier has no slots, so instances still have a dictionary.
+    #       Slots give faster access to the representation functions and
+    #       keep them out of that dictionary, which then stays empty.
+    __slots__ = ( '_repr_function', '_str_function' )
+
     def __init__(
         self,
         repr_function: __.typx.Annotated[
@@ -47,28 +57,41 @@ class AbsenceFactory( _falsifier.Falsifier ):
         super( ).__init__( )
 
     def __repr__( self ) -> str:
-        if self._repr_function is not None:
-            return self._repr_function( self )
-        return 'absence.AbsenceFactory( )'
+        function = self._repr_function
+        if function is None: return 'absence.AbsenceFactory( )'
+        return function( self )
 
     def __str__( self ) -> str:
-        if self._str_function is not None:
-            return self._str_function( self )
-        return 'absence'
+        function = self._str_function
+        if function is None: return 'absence'
+        return function( self )
 
     def __reduce__( self ) -> __.typx.Never:
-        from .exceptions import OperationValidityError
-        raise OperationValidityError( 'pickle' )
+        raise _exceptions.OperationValidityError( 'pickle' )
+
+
+# Note: Evaluated once, so that introspection of the postponed annotations
+#       by documentation generators or validators need not evaluate them.
+AbsenceFactory.__init__.__annotations__ = __.typx.get_type_hints(
+    AbsenceFactory.__init__, include_extras = True )
 
 
 class AbsentSingleton( AbsenceFactory ):
     ''' Produces global absence sentinel. '''
     # TODO: Instance immutability after initialization.
 
+    __slots__ = ( )
+
+    _instance: __.typx.ClassVar[ __.typx.Optional[ AbsentSingleton ] ] = None
+
     def __new__( selfclass ) -> __.typx.Self:
-        absent_ = globals( ).get( 'absent' )
-        if isinstance( absent_, selfclass ): return absent_
-        return super( ).__new__( selfclass )
+        # Note: Looked up in class dictionary so that subclasses do not
+        #       receive the instance of their parent.
+        instance = selfclass.__dict__.get( '_instance' )
+        if instance is None:
+            instance = super( ).__new__( selfclass )
+            selfclass._instance = instance
+        return instance
 
     def __repr__( self ) -> str:
         return 'absence.absent'
@@ -93,6 +116,11 @@ def is_absent( value: object ) -> __.typx.TypeIs[ AbsentSingleton ]:
 
 
 # Note: Separate typevar definition because it is less confusing to Pyright.
+# Note: Plain union alias rather than TypeAliasType. Construction is cheaper
+#       (about 0.3 versus 4.6 microseconds) and lazy evaluation of the alias
+#       value needs PEP 695 syntax, unavailable before Python 3.12.
+#       Subscripts, such as 'Absential[ int ]', also stay ordinary unions for
+#       runtime introspection by CLI and validation libraries.
 _V = __.typx.TypeVar( '_V' )
 Absential: __.typx.TypeAlias = _V | AbsentSingleton
 
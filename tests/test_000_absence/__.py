@@ -21,44 +21,53 @@
 ''' Common test utilities and helpers. '''
 
 
+import functools
+import os
 import types
 
-from pathlib import Path
-
 
 PACKAGE_NAME = 'absence'
 PACKAGES_NAMES = ( PACKAGE_NAME, )
 
 
-_modules_cache: dict[ str, types.ModuleType ] = { }
+@functools.cache
 def cache_import_module( qname: str ) -> types.ModuleType:
     ''' Imports module from package by name and caches it. '''
     from importlib import import_module
     package_name, *maybe_module_name = qname.rsplit( '.', maxsplit = 1 )
-    if not maybe_module_name: arguments = ( qname, )
-    else: arguments = ( f".{maybe_module_name[0]}", package_name, )
-    if qname not in _modules_cache:
-        _modules_cache[ qname ] = import_module( *arguments )
-    return _modules_cache[ qname ]
+    if not maybe_module_name: return import_module( qname )
+    return import_module( f".{maybe_module_name[0]}", package_name )
 
 
 def _discover_module_names( package_name: str ) -> tuple[ str, ... ]:
     package = cache_import_module( package_name )
     if not package.__file__: return ( )
-    return tuple(
-        path.stem
-        for path in Path( package.__file__ ).parent.glob( '*.py' )
-        if      path.name not in ( '__init__.py', '__main__.py' )
-            and path.is_file( ) )
+    # Note: Directory entries carry file type, avoiding a stat per path.
+    with os.scandir( os.path.dirname( package.__file__ ) ) as entries:
+        return tuple(
+            entry.name[ : -len( '.py' ) ] for entry in entries
+            if      entry.name.endswith( '.py' )
+                and entry.name not in ( '__init__.py', '__main__.py' )
+                and entry.is_file( ) )
+
+
+def _register_modules( ) -> tuple[ dict[ str, str ], dict[ str, str ] ]:
+    packages_names_by_module_qname: dict[ str, str ] = { }
+    modules_names_by_module_qname: dict[ str, str ] = { }
+    for package_name in PACKAGES_NAMES:
+        for module_name in MODULES_NAMES_BY_PACKAGE_NAME[ package_name ]:
+            module_qname = f"{package_name}.{module_name}"
+            packages_names_by_module_qname[ module_qname ] = package_name
+            modules_names_by_module_qname[ module_qname ] = module_name
+    return packages_names_by_module_qname, modules_names_by_module_qname
 
 
 MODULES_NAMES_BY_PACKAGE_NAME = types.MappingProxyType( {
     name: _discover_module_names( name ) for name in PACKAGES_NAMES } )
-PACKAGES_NAMES_BY_MODULE_QNAME = types.MappingProxyType( {
-    f"{subpackage_name}.{module_name}": subpackage_name
-    for subpackage_name in PACKAGES_NAMES
-    for module_name in MODULES_NAMES_BY_PACKAGE_NAME[ subpackage_name ] } )
-MODULES_QNAMES = tuple( PACKAGES_NAMES_BY_MODULE_QNAME.keys( ) )
-MODULES_NAMES_BY_MODULE_QNAME = types.MappingProxyType( {
-    name: name.rsplit( '.', maxsplit = 1 )[ -1 ]
-    for name in PACKAGES_NAMES_BY_MODULE_QNAME } )
\ No newline at end of file
+_packages_names_by_module_qname, _modules_names_by_module_qname = (
+    _register_modules( ) )
+PACKAGES_NAMES_BY_MODULE_QNAME = types.MappingProxyType(
+    _packages_names_by_module_qname )
+MODULES_QNAMES = tuple( _packages_names_by_module_qname )
+MODULES_NAMES_BY_MODULE_QNAME = types.MappingProxyType(
+    _modules_names_by_module_qname )
@@ -1,3 +1,26 @@
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
 def pytest_sessionfinish( session, exitstatus ):
     if exitstatus == 5:  # pytest exit code for "no tests collected"
         session.exitstatus = 0
+
+
+@pytest.fixture( scope = 'module' )
+def exceptions( ):
+    ''' Package exceptions module. '''
+    return cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+
+@pytest.fixture( scope = 'module' )
+def installers( ):
+    ''' Package installers module. '''
+    return cache_import_module( f"{PACKAGE_NAME}.installers" )
+
+
+@pytest.fixture( scope = 'module' )
+def objects( ):
+    ''' Package objects module. '''
+    return cache_import_module( f"{PACKAGE_NAME}.objects" )
@@ -27,7 +27,7 @@ from . import __
 
 
 @pytest.mark.parametrize(
-    'module_name', ( 'cabc', 'types', 'typx' )
+    'module_name', ( 'cabc', 'funct', 'types', 'typx' )
 )
 def test_100_exports( module_name ):
     ''' Module exports expected names. '''
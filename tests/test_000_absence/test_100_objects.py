@@ -25,58 +25,58 @@ import pickle
 
 import pytest
 
-from .__ import PACKAGE_NAME, cache_import_module
 
-
-def test_100_singleton_identity( ):
+def test_100_singleton_identity( objects ):
     ''' Global sentinel maintains identity. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    assert module.absent is module.AbsentSingleton( )
+    assert objects.absent is objects.AbsentSingleton( )
 
 
-def test_101_singleton_boolean_evaluation( ):
+def test_101_singleton_boolean_evaluation( objects ):
     ''' Global sentinel evaluates to False. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    assert not module.absent
-    assert False is bool( module.absent )
+    assert not objects.absent
+    assert False is bool( objects.absent )
 
 
-def test_102_singleton_string_representations( ):
+def test_102_singleton_string_representations( objects ):
     ''' Global sentinel has expected string representations. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    assert 'absent' == str( module.absent )
-    assert 'absence.absent' == repr( module.absent )
+    assert 'absent' == str( objects.absent )
+    assert 'absence.absent' == repr( objects.absent )
+
 
+def test_103_singleton_subclass_identity( objects ):
+    ''' Singleton subclasses maintain their own identity. '''
+    class Subsingleton( objects.AbsentSingleton ): pass
+    instance = Subsingleton( )
+    assert instance is Subsingleton( )
+    assert instance is not objects.absent
+    assert objects.absent is objects.AbsentSingleton( )
 
-def test_200_factory_instantiation( ):
+
+def test_200_factory_instantiation( objects ):
     ''' Factory produces unique instances. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    obj1 = module.AbsenceFactory( )
-    obj2 = module.AbsenceFactory( )
+    obj1 = objects.AbsenceFactory( )
+    obj2 = objects.AbsenceFactory( )
     assert obj1 is not obj2
     assert obj1 != obj2
 
 
-def test_201_factory_boolean_evaluation( ):
+def test_201_factory_boolean_evaluation( objects ):
     ''' Factory instances evaluate to False. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    obj = module.AbsenceFactory( )
+    obj = objects.AbsenceFactory( )
     assert not obj
     assert False is bool( obj )
 
 
-def test_202_factory_default_strings( ):
+def test_202_factory_default_strings( objects ):
     ''' Factory instances have expected default string representations. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    obj = module.AbsenceFactory( )
+    obj = objects.AbsenceFactory( )
     assert 'absence' == str( obj )
     assert 'absence.AbsenceFactory( )' == repr( obj )
 
 
-def test_203_factory_custom_strings( ):
+def test_203_factory_custom_strings( objects ):
     ''' Factory instances support custom string representations. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    obj = module.AbsenceFactory(
+    obj = objects.AbsenceFactory(
         repr_function = lambda self: 'custom_repr',
         str_function = lambda self: 'custom_str',
     )
@@ -84,37 +84,34 @@ def test_203_factory_custom_strings( ):
     assert 'custom_repr' == repr( obj )
 
 
-def test_204_factory_pickle( ):
+def test_204_factory_pickle( objects, exceptions ):
     ''' Factory instances cannot be pickled. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
-    obj = module.AbsenceFactory( )
+    obj = objects.AbsenceFactory( )
     with pytest.raises( exceptions.OperationValidityError ):
         pickle.dumps( obj )
+    with pytest.raises( exceptions.OperationValidityError ):
+        obj.__reduce__( )
 
 
-def test_300_is_absent_predicate( ):
+def test_300_is_absent_predicate( objects ):
     ''' is_absent predicate identifies global sentinel. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    assert module.is_absent( module.absent )
-    assert not module.is_absent( module.AbsenceFactory( ) )
-    assert not module.is_absent( None )
-    assert not module.is_absent( False )
+    assert objects.is_absent( objects.absent )
+    assert not objects.is_absent( objects.AbsenceFactory( ) )
+    assert not objects.is_absent( None )
+    assert not objects.is_absent( False )
 
 
-def test_301_is_absence_predicate( ):
+def test_301_is_absence_predicate( objects ):
     ''' is_absence predicate identifies all absence types. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    assert module.is_absence( module.absent )
-    assert module.is_absence( module.AbsenceFactory( ) )
-    assert not module.is_absence( None )
-    assert not module.is_absence( False )
+    assert objects.is_absence( objects.absent )
+    assert objects.is_absence( objects.AbsenceFactory( ) )
+    assert not objects.is_absence( None )
+    assert not objects.is_absence( False )
 
 
-def test_900_docstring_sanity( ):
+def test_900_docstring_sanity( objects ):
     ''' Classes have valid docstrings. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    for class_ in ( module.AbsentSingleton, module.AbsenceFactory ):
+    for class_ in ( objects.AbsentSingleton, objects.AbsenceFactory ):
         assert hasattr( class_, '__doc__' )
         assert isinstance( class_.__doc__, str )
         assert class_.__doc__
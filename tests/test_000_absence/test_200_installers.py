@@ -25,8 +25,6 @@ import builtins
 
 import pytest
 
-from .__ import PACKAGE_NAME, cache_import_module
-
 
 @pytest.fixture
 def cleanup_builtins( ):
@@ -37,22 +35,18 @@ def cleanup_builtins( ):
             delattr( builtins, name )
 
 
-def test_100_default_install( cleanup_builtins ):
+def test_100_default_install( cleanup_builtins, installers, objects ):
     ''' Default installation works. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.installers" )
-    objects = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    module.install( )
+    installers.install( )
     assert hasattr( builtins, 'Absent' )
     assert hasattr( builtins, 'isabsent' )
     assert objects.absent is builtins.Absent
     assert objects.is_absent is builtins.isabsent
 
 
-def test_101_custom_install( cleanup_builtins ):
+def test_101_custom_install( cleanup_builtins, installers, objects ):
     ''' Custom installation works. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.installers" )
-    objects = cache_import_module( f"{PACKAGE_NAME}.objects" )
-    module.install(
+    installers.install(
         sentinel_name = 'CustomAbsent',
         predicate_name = 'custom_absent',
     )
@@ -62,13 +56,12 @@ def test_101_custom_install( cleanup_builtins ):
     assert objects.is_absent is builtins.custom_absent
 
 
-def test_102_partial_install( cleanup_builtins ):
+def test_102_partial_install( cleanup_builtins, installers ):
     ''' Partial installation works. '''
-    module = cache_import_module( f"{PACKAGE_NAME}.installers" )
-    module.install( sentinel_name = None )
+    installers.install( sentinel_name = None )
     assert not hasattr( builtins, 'Absent' )
     assert hasattr( builtins, 'isabsent' )
     delattr( builtins, 'isabsent' )
-    module.install( predicate_name = None )
+    installers.install( predicate_name = None )
     assert hasattr( builtins, 'Absent' )
     assert not hasattr( builtins, 'isabsent' )